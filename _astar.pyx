@@ -0,0 +1,136 @@
+# cython: language_level=3
+"""
+Cython A* kernel for environments without Numba.
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+main.a_star_search picks this module up automatically when Numba is not
+installed. It mirrors main._a_star_kernel: flat indices into the padded
+wall bitmap, an array-backed binary heap and a closed bitset, all typed
+so the loop runs without the GIL or Python objects.
+"""
+
+import numpy as np
+
+cimport cython
+
+cdef int INT32_MAX = 2147483647
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline int _heap_push(int[::1] heap_f, int[::1] heap_idx, int size, int f, int idx) noexcept nogil:
+    """Push (f, idx) onto the heap; returns the new size."""
+    cdef int i = size
+    cdef int parent
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap_f[parent] <= f:
+            break
+        heap_f[i] = heap_f[parent]
+        heap_idx[i] = heap_idx[parent]
+        i = parent
+    heap_f[i] = f
+    heap_idx[i] = idx
+    return size + 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline int _heap_pop(int[::1] heap_f, int[::1] heap_idx, int size, int* top_idx) noexcept nogil:
+    """Pop the minimum entry into top_idx; returns the new size."""
+    cdef int i = 0
+    cdef int child
+    cdef int last_f
+    cdef int last_idx
+    top_idx[0] = heap_idx[0]
+    size -= 1
+    last_f = heap_f[size]
+    last_idx = heap_idx[size]
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if heap_f[child] >= last_f:
+            break
+        heap_f[i] = heap_f[child]
+        heap_idx[i] = heap_idx[child]
+        i = child
+    heap_f[i] = last_f
+    heap_idx[i] = last_idx
+    return size
+
+
+cdef inline int _manhattan(int idx, int width, int goal_r, int goal_c) noexcept nogil:
+    cdef int dr = idx // width - goal_r
+    cdef int dc = idx % width - goal_c
+    return (dr if dr >= 0 else -dr) + (dc if dc >= 0 else -dc)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def astar(unsigned char[:, ::1] walls, int sr, int sc, int gr, int gc):
+    """
+    A* over the padded wall bitmap.
+
+    Args:
+        walls: Padded uint8 wall bitmap from MazeGrid.walls
+        sr, sc: Start position (row, col) in maze coordinates
+        gr, gc: Goal position (row, col) in maze coordinates
+
+    Returns:
+        int32 array mapping each flat cell index to its predecessor (-1 if none)
+    """
+    cdef int width = walls.shape[1]
+    cdef int n = walls.shape[0] * width
+    cdef int start = (sr + 1) * width + (sc + 1)
+    cdef int goal = (gr + 1) * width + (gc + 1)
+    cdef int goal_r = gr + 1
+    cdef int goal_c = gc + 1
+    cdef unsigned char* cells = &walls[0, 0]
+    cdef int[4] offsets = [-width, width, -1, 1]
+
+    parents = np.full(n, -1, dtype=np.int32)
+    cdef int[::1] came_from = parents
+    cdef int[::1] g_score = np.full(n, INT32_MAX, dtype=np.int32)
+    cdef unsigned char[::1] closed = np.zeros(n, dtype=np.uint8)
+    # Each cell is expanded at most once and relaxes at most 4 neighbors
+    cdef int[::1] heap_f = np.empty(4 * n + 1, dtype=np.int32)
+    cdef int[::1] heap_idx = np.empty(4 * n + 1, dtype=np.int32)
+
+    cdef int size
+    cdef int current = 0
+    cdef int neighbor
+    cdef int tentative_g_score
+    cdef int k
+
+    with nogil:
+        g_score[start] = 0
+        size = _heap_push(heap_f, heap_idx, 0, _manhattan(start, width, goal_r, goal_c), start)
+
+        while size > 0:
+            size = _heap_pop(heap_f, heap_idx, size, &current)
+            if current == goal:
+                break
+            # Manhattan distance is consistent, so a popped cell is final
+            if closed[current]:
+                continue
+            closed[current] = 1
+            tentative_g_score = g_score[current] + 1
+
+            for k in range(4):
+                neighbor = current + offsets[k]
+                if cells[neighbor] or closed[neighbor]:
+                    continue
+                if tentative_g_score < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    size = _heap_push(heap_f, heap_idx, size,
+                                      tentative_g_score + _manhattan(neighbor, width, goal_r, goal_c),
+                                      neighbor)
+
+    return parents
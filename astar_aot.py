@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compiled A* kernels for common maze sizes.
+
+Running this script compiles the `_astar_aot` extension module next to
+main.py with Numba's pycc:
+
+    python astar_aot.py
+
+The extension needs only NumPy at runtime, so there is no JIT warm-up and
+it works where Numba is not installed. For 16x16, 64x64 and 256x256 mazes
+the padded row stride and cell count are compile-time constants, letting
+the compiler fold the neighbor offsets and heuristic arithmetic. Any other
+size goes through `astar_general`.
+
+Every kernel takes the packed wall bitmap (MazeGrid.wall_bits) and flat
+start/goal indices and returns the int32 predecessor array, like
+main._a_star_kernel.
+"""
+
+import numpy as np
+from numba import njit
+from numba.pycc import CC
+
+from main import INT32_MAX, _heap_pop, _heap_push
+
+cc = CC('_astar_aot')
+
+# Maze sizes (rows, cols) that get a specialized kernel
+SPECIALIZED_SIZES = [(16, 16), (64, 64), (256, 256)]
+
+
+@njit(inline='always')
+def _search(wall_bits, width, n, start, goal):
+    """
+    A* over the packed wall bitmap.
+
+    Inlined into every exported kernel, so width and n become constants in
+    the specialized ones.
+
+    Args:
+        wall_bits: Packed padded wall bitmap from MazeGrid.wall_bits
+        width: Row stride of the padded bitmap
+        n: Number of cells in the padded bitmap
+        start: Flat index of the start cell
+        goal: Flat index of the goal cell
+
+    Returns:
+        int32 array mapping each cell to its predecessor (-1 if none)
+    """
+    goal_r = goal // width
+    goal_c = goal % width
+
+    g_score = np.full(n, INT32_MAX, dtype=np.int32)
+    came_from = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.uint8)
+    heap_f = np.empty(4 * n + 1, dtype=np.int32)
+    heap_idx = np.empty(4 * n + 1, dtype=np.int32)
+
+    g_score[start] = 0
+    h = abs(start // width - goal_r) + abs(start % width - goal_c)
+    size = _heap_push(heap_f, heap_idx, 0, h, start)
+
+    while size > 0:
+        _, current, size = _heap_pop(heap_f, heap_idx, size)
+        if current == goal:
+            break
+        if closed[current]:
+            continue
+        closed[current] = 1
+        tentative_g_score = g_score[current] + 1
+
+        # Up, down, left, right; the sentinel border keeps all four in bounds
+        for k in range(4):
+            if k == 0:
+                neighbor = current - width
+            elif k == 1:
+                neighbor = current + width
+            elif k == 2:
+                neighbor = current - 1
+            else:
+                neighbor = current + 1
+            if (wall_bits[neighbor >> 3] >> (neighbor & 7)) & 1 or closed[neighbor]:
+                continue
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                h = abs(neighbor // width - goal_r) + abs(neighbor % width - goal_c)
+                size = _heap_push(heap_f, heap_idx, size, tentative_g_score + h, neighbor)
+
+    return came_from
+
+
+@cc.export('astar_16x16', 'i4[:](u1[:], i4, i4)')
+def astar_16x16(wall_bits, start, goal):
+    return _search(wall_bits, 18, 18 * 18, start, goal)
+
+
+@cc.export('astar_64x64', 'i4[:](u1[:], i4, i4)')
+def astar_64x64(wall_bits, start, goal):
+    return _search(wall_bits, 66, 66 * 66, start, goal)
+
+
+@cc.export('astar_256x256', 'i4[:](u1[:], i4, i4)')
+def astar_256x256(wall_bits, start, goal):
+    return _search(wall_bits, 258, 258 * 258, start, goal)
+
+
+@cc.export('astar_general', 'i4[:](u1[:], i4, i4, i4, i4)')
+def astar_general(wall_bits, width, n, start, goal):
+    return _search(wall_bits, width, n, start, goal)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -7,8 +7,76 @@ path through a maze from a start point to a goal point, navigating around obstac
 """
 
 import heapq
-from typing import List, Tuple, Optional, Set
-from collections import defaultdict
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional, Sequence, Set
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Ahead-of-time compiled kernels, built with `python astar_aot.py`
+try:
+    import _astar_aot
+except ImportError:
+    _astar_aot = None
+
+# Cython kernel, built with `python setup.py build_ext --inplace`
+try:
+    from _astar import astar as _cython_astar
+except ImportError:
+    _cython_astar = None
+
+# Characters allowed in a user-entered maze
+MAZE_SYMBOLS = frozenset('SG# ')
+
+# Wall bitmap cell values
+OPEN = 0
+WALL = 1
+
+# "Infinite" g_score for flat int32 score arrays
+INT32_MAX = int(np.iinfo(np.int32).max)
+
+# Four directions: up, down, left, right (index k is used by goal bounds)
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# Queries per parallel solve_many batch; bounds the (queries, cells)
+# predecessor matrix the batch kernel allocates
+SOLVE_MANY_BATCH = 32
+
+# Widest maze whose padded rows fit in one uint64 row word
+MAX_ROW_WORD_COLS = 62
+
+# Goal bounds bounding-box layout along the last axis
+RMIN, RMAX, CMIN, CMAX = 0, 1, 2, 3
+
+# ANSI color codes for terminal
+RESET = '\033[0m'
+GREEN = '\033[92m'      # Start
+RED = '\033[91m'        # Goal
+YELLOW = '\033[93m'     # Path
+BLUE = '\033[94m'       # Wall
+WHITE = '\033[97m'      # Empty space
+
+# Rendered form of each maze cell, including the trailing separator
+RENDER = {
+    'S': f"{GREEN}S{RESET} ",
+    'G': f"{RED}G{RESET} ",
+    '#': f"{BLUE}#{RESET} ",
+    '*': f"{YELLOW}*{RESET} ",
+    ' ': f"{WHITE}.{RESET} ",
+}
 
 
 class MazeGrid:
@@ -16,7 +84,7 @@ class MazeGrid:
     Represents a maze grid with walls, start, and goal positions.
     """
     
-    def __init__(self, grid: List[List[str]]):
+    def __init__(self, grid: List[List[str]], precompute: bool = False):
         """
         Initialize the maze grid.
         
@@ -26,29 +94,166 @@ class MazeGrid:
                   'G' = Goal position
                   '#' = Wall/Obstacle
                   ' ' = Open path
+            precompute: Also build the goal bounds table (O(n^2) in the
+                        number of cells), worthwhile for repeated queries
         """
         self.grid = grid
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
         
-        start_pos = self._find_position('S')
-        goal_pos = self._find_position('G')
+        # One array scan per symbol instead of Python loops over the grid
+        cells = np.array(grid, dtype='U1').reshape(self.rows, self.cols)
+        start_hits = np.argwhere(cells == 'S')
+        goal_hits = np.argwhere(cells == 'G')
         
-        if not start_pos:
+        if not len(start_hits):
             raise ValueError("Start position 'S' not found in maze!")
-        if not goal_pos:
+        if not len(goal_hits):
             raise ValueError("Goal position 'G' not found in maze!")
         
-        self.start: Tuple[int, int] = start_pos
-        self.goal: Tuple[int, int] = goal_pos
+        self.start: Tuple[int, int] = (int(start_hits[0][0]), int(start_hits[0][1]))
+        self.goal: Tuple[int, int] = (int(goal_hits[0][0]), int(goal_hits[0][1]))
+        
+        # Wall bitmap: WALL or OPEN per cell, surrounded by a 1-cell WALL
+        # border so neighbor probes never need a bounds check. Cell (r, c)
+        # of the maze lives at walls[r + 1, c + 1].
+        walls = np.where(cells == '#', WALL, OPEN).astype(np.uint8)
+        walls = np.pad(walls, 1, constant_values=WALL)
+        
+        # Row stride of the padded bitmap, used for flat cell indices
+        self.width = self.cols + 2
+        
+        # Store the bitmap packed at one bit per cell (bit idx & 7 of byte
+        # idx >> 3) so large mazes stay cache resident; see is_wall()
+        flat = walls.ravel()
+        self.wall_bits: np.ndarray = np.packbits(flat, bitorder='little')
+        
+        # For mazes up to MAX_ROW_WORD_COLS wide, each padded row also fits
+        # in one 64-bit word: bit c + 1 is cell (r, c), and bit 0 plus every
+        # bit past the last column are sentinel walls. is_valid() and
+        # get_neighbors() then use shifts and masks on three words (the rows
+        # above, at and below the cell), with no bounds checks. The words
+        # are Python ints because NumPy uint64 scalars are slower to shift
+        # in pure Python; the compiled kernels use the CSR adjacency instead.
+        self._row_words: Optional[List[int]] = None
+        if self.cols <= MAX_ROW_WORD_COLS:
+            sentinel = ~((1 << self.width) - 1) & ((1 << 64) - 1)
+            self._row_words = [
+                int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little') | sentinel
+                for row in walls
+            ]
+        
+        # CSR adjacency over flat indices: the open neighbors of cell idx are
+        # nbr_data[nbr_offsets[idx]:nbr_offsets[idx + 1]], in DIRECTIONS order,
+        # and nbr_dirs holds the DIRECTIONS index of each of those edges.
+        # This, not the bitmap, is what the searches touch per expansion.
+        open_cells = np.flatnonzero(flat == OPEN)
+        self.open_count = int(open_cells.size)
+        candidates = open_cells[:, None] + np.array([-self.width, self.width, -1, 1])
+        edges = flat[candidates] == OPEN
+        self.nbr_offsets = np.zeros(flat.size + 1, dtype=np.int32)
+        self.nbr_offsets[open_cells + 1] = edges.sum(axis=1)
+        np.cumsum(self.nbr_offsets, out=self.nbr_offsets)
+        self.nbr_data = candidates[edges].astype(np.int32)
+        self.nbr_dirs = np.nonzero(edges)[1].astype(np.int8)
+        
+        # Optional goal bounds table, see precompute_goal_bounds()
+        self.goal_bounds: Optional[np.ndarray] = None
+        if precompute:
+            self.precompute_goal_bounds()
     
-    def _find_position(self, symbol: str) -> Optional[Tuple[int, int]]:
-        """Find the position of a specific symbol in the grid."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r][c] == symbol:
-                    return (r, c)
-        return None
+    def precompute_goal_bounds(self) -> np.ndarray:
+        """
+        Build the Goal Bounding table used to prune A* expansions.
+        
+        A breadth-first search from every open cell records, for each of the
+        cell's four outgoing edges, the bounding box of all cells whose
+        shortest path starts with that edge. During search an edge is only
+        relaxed if the goal lies inside its box.
+        
+        Returns:
+            int16 array of shape (rows, cols, 4, 4): for each cell and
+            direction in DIRECTIONS order, (RMIN, RMAX, CMIN, CMAX) in maze
+            coordinates; empty boxes have RMIN > RMAX
+        """
+        self.goal_bounds = _goal_bounds_kernel(self.nbr_offsets, self.nbr_data, self.nbr_dirs,
+                                               self.width, self.rows, self.cols)
+        return self.goal_bounds
+    
+    def solve_many(self, starts: Sequence[Tuple[int, int]],
+                   goals: Sequence[Tuple[int, int]]) -> List[Optional[List[Tuple[int, int]]]]:
+        """
+        Solve many start/goal queries on this maze in one batch.
+        
+        The wall bitmap, CSR adjacency and (if precomputed) goal bounds are
+        built once in __init__ and shared by every query. With Numba the
+        queries run in parallel across cores, each with private search
+        arrays; otherwise they are solved one after another.
+        
+        Args:
+            starts: Start position (row, col) of each query
+            goals: Goal position (row, col) of each query
+            
+        Returns:
+            One path (list of positions) per query, or None where unreachable
+            (including queries whose start or goal is a wall)
+            
+        Raises:
+            ValueError: If the lengths differ or a position is outside the maze
+        """
+        if len(starts) != len(goals):
+            raise ValueError("solve_many needs exactly one goal per start!")
+        # Plain (int, int) tuples, so NumPy rows work as positions too
+        starts = [(int(pos[0]), int(pos[1])) for pos in starts]
+        goals = [(int(pos[0]), int(pos[1])) for pos in goals]
+        for pos in (*starts, *goals):
+            if not (0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols):
+                raise ValueError(f"Position {pos} is outside the maze!")
+        
+        # A query starting or ending on a wall has no path
+        paths: List[Optional[List[Tuple[int, int]]]] = [None] * len(starts)
+        queries = [q for q in range(len(starts)) if self.is_valid(starts[q]) and self.is_valid(goals[q])]
+        
+        if not NUMBA_AVAILABLE:
+            for q in queries:
+                paths[q] = _a_star_python(self, starts[q], goals[q])
+            return paths
+        
+        # Solve in batches so the predecessor matrix stays SOLVE_MANY_BATCH x cells
+        goal_bounds = _NO_GOAL_BOUNDS if self.goal_bounds is None else self.goal_bounds
+        for first in range(0, len(queries), SOLVE_MANY_BATCH):
+            batch = queries[first:first + SOLVE_MANY_BATCH]
+            start_idx = np.array([self.to_index(starts[q]) for q in batch], dtype=np.int32)
+            goal_idx = np.array([self.to_index(goals[q]) for q in batch], dtype=np.int32)
+            came_from = _solve_many_kernel(self.nbr_offsets, self.nbr_data, self.nbr_dirs, self.width,
+                                           start_idx, goal_idx, goal_bounds)
+            for i, q in enumerate(batch):
+                paths[q] = reconstruct_index_path(self, came_from[i], int(goal_idx[i]), int(start_idx[i]))
+        return paths
+    
+    def to_index(self, pos: Tuple[int, int]) -> int:
+        """Convert a (row, col) position to a flat index into the padded bitmap."""
+        return (pos[0] + 1) * self.width + (pos[1] + 1)
+    
+    def to_pos(self, idx: int) -> Tuple[int, int]:
+        """Convert a flat index into the padded bitmap back to (row, col)."""
+        row, col = divmod(int(idx), self.width)
+        return (row - 1, col - 1)
+    
+    @property
+    def walls(self) -> np.ndarray:
+        """Padded uint8 wall bitmap, unpacked from wall_bits on each access."""
+        n = (self.rows + 2) * self.width
+        cells = np.unpackbits(self.wall_bits, count=n, bitorder='little')
+        return cells.reshape(self.rows + 2, self.width)
+    
+    def is_wall(self, idx: int) -> bool:
+        """Check the packed bitmap for a wall at flat cell idx."""
+        return (self.wall_bits[idx >> 3] >> (idx & 7)) & 1 == WALL
+    
+    def neighbors_of(self, idx: int) -> np.ndarray:
+        """Return the flat indices of the open neighbors of flat cell idx."""
+        return self.nbr_data[self.nbr_offsets[idx]:self.nbr_offsets[idx + 1]]
     
     def is_valid(self, pos: Tuple[int, int]) -> bool:
         """
@@ -60,10 +265,14 @@ class MazeGrid:
         Returns:
             True if position is within bounds and not a wall
         """
-        row, col = pos
-        if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.grid[row][col] != '#'
-        return False
+        # Plain ints: shifting a row word (above 2**63) by a NumPy integer
+        # would make NumPy convert the word to a C long and overflow
+        row, col = int(pos[0]), int(pos[1])
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        if self._row_words is not None:
+            return not (self._row_words[row + 1] >> (col + 1)) & 1
+        return not self.is_wall(self.to_index((row, col)))
     
     def get_neighbors(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
@@ -75,12 +284,25 @@ class MazeGrid:
         Returns:
             List of valid neighbor positions
         """
-        row, col = pos
-        # Four directions: up, down, left, right
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        row, col = int(pos[0]), int(pos[1])
         neighbors = []
         
-        for dr, dc in directions:
+        words = self._row_words
+        if words is not None:
+            # Three row words answer all four probes, in DIRECTIONS order
+            shift = col + 1
+            here = words[row + 1]
+            if not (words[row] >> shift) & 1:
+                neighbors.append((row - 1, col))
+            if not (words[row + 2] >> shift) & 1:
+                neighbors.append((row + 1, col))
+            if not (here >> (shift - 1)) & 1:
+                neighbors.append((row, col - 1))
+            if not (here >> (shift + 1)) & 1:
+                neighbors.append((row, col + 1))
+            return neighbors
+        
+        for dr, dc in DIRECTIONS:
             new_pos = (row + dr, col + dc)
             if self.is_valid(new_pos):
                 neighbors.append(new_pos)
@@ -105,8 +327,323 @@ def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
 
+def manhattan_table(maze: MazeGrid, target: Tuple[int, int]) -> np.ndarray:
+    """
+    Precompute the Manhattan distance from every cell to a target.
+    
+    Args:
+        maze: MazeGrid the table is built for
+        target: Position (row, col) distances are measured to
+        
+    Returns:
+        int32 array indexed by flat cell index of the padded bitmap
+    """
+    rr = np.arange(maze.rows + 2).reshape(-1, 1)
+    cc = np.arange(maze.width).reshape(1, -1)
+    table = np.abs(rr - (target[0] + 1)) + np.abs(cc - (target[1] + 1))
+    return table.ravel().astype(np.int32)
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_idx, size, f, idx):
+    """Push (f, idx) onto an array-backed binary min-heap; returns the new size."""
+    # Sift up: move parents down until the slot for f is found
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap_f[parent] <= f:
+            break
+        heap_f[i] = heap_f[parent]
+        heap_idx[i] = heap_idx[parent]
+        i = parent
+    heap_f[i] = f
+    heap_idx[i] = idx
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_idx, size):
+    """Pop the minimum entry of an array-backed heap; returns (f, idx, new_size)."""
+    top_f = heap_f[0]
+    top_idx = heap_idx[0]
+    size -= 1
+    last_f = heap_f[size]
+    last_idx = heap_idx[size]
+    
+    # Sift down: move the smaller child up until the slot for last_f is found
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if heap_f[child] >= last_f:
+            break
+        heap_f[i] = heap_f[child]
+        heap_idx[i] = heap_idx[child]
+        i = child
+    heap_f[i] = last_f
+    heap_idx[i] = last_idx
+    return top_f, top_idx, size
+
+
+@njit(cache=True)
+def _goal_bounds_kernel(nbr_offsets, nbr_data, nbr_dirs, width, rows, cols):
+    """
+    Compute the goal bounds table with one BFS per open cell.
+    
+    See MazeGrid.precompute_goal_bounds() for the layout of the result.
+    """
+    n = nbr_offsets.size - 1
+    
+    # Start with empty boxes
+    bounds = np.empty((rows, cols, 4, 4), dtype=np.int16)
+    bounds[:, :, :, RMIN] = rows
+    bounds[:, :, :, RMAX] = -1
+    bounds[:, :, :, CMIN] = cols
+    bounds[:, :, :, CMAX] = -1
+    
+    queue = np.empty(n, dtype=np.int32)
+    first_edge = np.empty(n, dtype=np.int8)
+    # seen[idx] == source + 1 marks idx as visited by the BFS from source
+    seen = np.zeros(n, dtype=np.int32)
+    
+    for source in range(n):
+        # Walls and isolated cells have no edges to bound
+        if nbr_offsets[source] == nbr_offsets[source + 1]:
+            continue
+        sr = source // width - 1
+        sc = source % width - 1
+        seen[source] = source + 1
+        head = 0
+        tail = 0
+        
+        # Seed the BFS with the source's neighbors, labeled by edge
+        for e in range(nbr_offsets[source], nbr_offsets[source + 1]):
+            neighbor = nbr_data[e]
+            seen[neighbor] = source + 1
+            first_edge[neighbor] = nbr_dirs[e]
+            queue[tail] = neighbor
+            tail += 1
+        
+        while head < tail:
+            current = queue[head]
+            head += 1
+            k = first_edge[current]
+            r = current // width - 1
+            c = current % width - 1
+            
+            # Grow the box of the edge this cell is first reached through
+            box = bounds[sr, sc, k]
+            if r < box[RMIN]:
+                box[RMIN] = r
+            if r > box[RMAX]:
+                box[RMAX] = r
+            if c < box[CMIN]:
+                box[CMIN] = c
+            if c > box[CMAX]:
+                box[CMAX] = c
+            
+            for e in range(nbr_offsets[current], nbr_offsets[current + 1]):
+                neighbor = nbr_data[e]
+                if seen[neighbor] != source + 1:
+                    seen[neighbor] = source + 1
+                    first_edge[neighbor] = k
+                    queue[tail] = neighbor
+                    tail += 1
+    
+    return bounds
+
+
+# Placeholder passed to kernels when goal bounds have not been precomputed
+_NO_GOAL_BOUNDS = np.empty((0, 0, 4, 4), dtype=np.int16)
+
+
+@njit(cache=True, boundscheck=False)
+def _a_star_kernel(nbr_offsets, nbr_data, nbr_dirs, width, start, goal, h_table, goal_bounds):
+    """
+    Numba-compiled A* over the maze's CSR adjacency.
+    
+    Cells are flat indices into the padded wall bitmap; neighbors come
+    straight from the precomputed adjacency, so the loop does no wall or
+    bounds checks.
+    
+    Args:
+        nbr_offsets, nbr_data, nbr_dirs: CSR adjacency from MazeGrid
+        width: Row stride of the padded bitmap
+        start: Flat index of the start cell
+        goal: Flat index of the goal cell
+        h_table: Heuristic per cell from manhattan_table()
+        goal_bounds: Table from MazeGrid.precompute_goal_bounds(), or an
+                     empty array to relax every edge
+        
+    Returns:
+        int32 array mapping each cell to its predecessor (-1 if none)
+    """
+    n = nbr_offsets.size - 1
+    goal_r = goal // width
+    goal_c = goal % width
+    use_bounds = goal_bounds.shape[0] > 0
+    
+    g_score = np.full(n, INT32_MAX, dtype=np.int32)
+    came_from = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.uint8)
+    
+    # Each cell is expanded at most once and relaxes at most 4 neighbors
+    heap_f = np.empty(4 * n + 1, dtype=np.int32)
+    heap_idx = np.empty(4 * n + 1, dtype=np.int32)
+    
+    g_score[start] = 0
+    size = _heap_push(heap_f, heap_idx, 0, h_table[start], start)
+    
+    while size > 0:
+        _, current, size = _heap_pop(heap_f, heap_idx, size)
+        if current == goal:
+            break
+        
+        # Manhattan distance is consistent, so a popped cell is final:
+        # skip stale heap entries for cells that are already closed
+        if closed[current]:
+            continue
+        closed[current] = 1
+        g = g_score[current]
+        
+        for e in range(nbr_offsets[current], nbr_offsets[current + 1]):
+            neighbor = nbr_data[e]
+            if closed[neighbor]:
+                continue
+            if use_bounds:
+                # Skip edges whose goal bounds exclude the goal (maze coordinates)
+                box = goal_bounds[current // width - 1, current % width - 1, nbr_dirs[e]]
+                if not (box[RMIN] <= goal_r - 1 <= box[RMAX] and box[CMIN] <= goal_c - 1 <= box[CMAX]):
+                    continue
+            tentative_g_score = g + 1
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                size = _heap_push(heap_f, heap_idx, size, tentative_g_score + h_table[neighbor], neighbor)
+    
+    return came_from
+
+
+@njit(cache=True, parallel=True)
+def _solve_many_kernel(nbr_offsets, nbr_data, nbr_dirs, width, starts, goals, goal_bounds):
+    """
+    Run independent A* queries in parallel over a shared CSR adjacency.
+    
+    Each query gets its own heuristic table and search arrays, so the
+    iterations need no synchronization.
+    
+    Returns:
+        int32 array of shape (queries, cells): the predecessor array of each query
+    """
+    n = nbr_offsets.size - 1
+    came_from = np.empty((starts.size, n), dtype=np.int32)
+    for q in prange(starts.size):
+        goal_r = goals[q] // width
+        goal_c = goals[q] % width
+        h_table = np.empty(n, dtype=np.int32)
+        for idx in range(n):
+            h_table[idx] = abs(idx // width - goal_r) + abs(idx % width - goal_c)
+        came_from[q] = _a_star_kernel(nbr_offsets, nbr_data, nbr_dirs, width,
+                                      starts[q], goals[q], h_table, goal_bounds)
+    return came_from
+
+
+# a_star_search implementations, as reported by a_star_backend()
+BACKEND_AOT_SPECIALIZED = 'aot-specialized'
+BACKEND_NUMBA = 'numba'
+BACKEND_CYTHON = 'cython'
+BACKEND_AOT_GENERAL = 'aot-general'
+BACKEND_PYTHON = 'python'
+
+# Priority queue each backend uses, for the results footer
+BACKEND_QUEUES = {
+    BACKEND_AOT_SPECIALIZED: "Array-Backed Binary Heap (AOT-compiled, size-specialized)",
+    BACKEND_NUMBA: "Array-Backed Binary Heap (Numba)",
+    BACKEND_CYTHON: "Array-Backed Binary Heap (Cython)",
+    BACKEND_AOT_GENERAL: "Array-Backed Binary Heap (AOT-compiled)",
+    BACKEND_PYTHON: "Bucket Queue (Dial's algorithm)",
+}
+
+
+def a_star_backend(maze: MazeGrid) -> str:
+    """
+    Choose the A* implementation a_star_search will run for this maze.
+    
+    Picks the fastest available implementation, in order:
+        1. An ahead-of-time kernel specialized for this maze size
+        2. The Numba JIT kernel, when Numba is installed
+        3. The Cython kernel (see _astar.pyx)
+        4. The general ahead-of-time kernel
+        5. The pure-Python implementation
+    Only the Numba and pure-Python implementations prune with goal bounds.
+    A size-specialized kernel gives way to Numba when bounds have been
+    precomputed; otherwise bounds never displace a compiled kernel, which
+    then simply searches without pruning.
+    
+    Args:
+        maze: MazeGrid object containing the maze
+        
+    Returns:
+        One of the BACKEND_* constants
+    """
+    numba_prunes = NUMBA_AVAILABLE and maze.goal_bounds is not None
+    if not numba_prunes and hasattr(_astar_aot, f"astar_{maze.rows}x{maze.cols}"):
+        return BACKEND_AOT_SPECIALIZED
+    if NUMBA_AVAILABLE:
+        return BACKEND_NUMBA
+    if _cython_astar is not None:
+        return BACKEND_CYTHON
+    if _astar_aot is not None:
+        return BACKEND_AOT_GENERAL
+    return BACKEND_PYTHON
+
+
 def a_star_search(maze: MazeGrid) -> Optional[List[Tuple[int, int]]]:
     """
+    Find the shortest path with A* Search.
+    
+    Runs the implementation chosen by a_star_backend().
+    
+    Args:
+        maze: MazeGrid object containing the maze
+        
+    Returns:
+        List of (row, col) tuples representing the path, or None if unreachable
+    """
+    backend = a_star_backend(maze)
+    if backend == BACKEND_PYTHON:
+        return _a_star_python(maze)
+    
+    start_idx = maze.to_index(maze.start)
+    goal_idx = maze.to_index(maze.goal)
+    
+    if backend == BACKEND_AOT_SPECIALIZED:
+        specialized = getattr(_astar_aot, f"astar_{maze.rows}x{maze.cols}")
+        came_from = specialized(maze.wall_bits, start_idx, goal_idx)
+        return reconstruct_index_path(maze, came_from, goal_idx)
+    
+    if backend == BACKEND_CYTHON:
+        came_from = _cython_astar(maze.walls, *maze.start, *maze.goal)
+        return reconstruct_index_path(maze, came_from, goal_idx)
+    
+    if backend == BACKEND_AOT_GENERAL:
+        n = (maze.rows + 2) * maze.width
+        came_from = _astar_aot.astar_general(maze.wall_bits, maze.width, n, start_idx, goal_idx)
+        return reconstruct_index_path(maze, came_from, goal_idx)
+    
+    goal_bounds = _NO_GOAL_BOUNDS if maze.goal_bounds is None else maze.goal_bounds
+    h_table = manhattan_table(maze, maze.goal)
+    came_from = _a_star_kernel(maze.nbr_offsets, maze.nbr_data, maze.nbr_dirs, maze.width,
+                               start_idx, goal_idx, h_table, goal_bounds)
+    return reconstruct_index_path(maze, came_from, goal_idx)
+
+
+def _a_star_python(maze: MazeGrid, start_pos: Optional[Tuple[int, int]] = None,
+                   goal_pos: Optional[Tuple[int, int]] = None) -> Optional[List[Tuple[int, int]]]:
+    """
     Implement A* Search algorithm to find the shortest path.
     
     A* uses: f(n) = g(n) + h(n)
@@ -115,67 +652,315 @@ def a_star_search(maze: MazeGrid) -> Optional[List[Tuple[int, int]]]:
         h(n) = heuristic estimated cost from node n to goal
         f(n) = total estimated cost of path through node n
     
+    Cells are flat indices into the padded wall bitmap and scores live in
+    plain lists indexed by cell, so the loop does no tuple hashing.
+    
+    With unit step costs and an integer, consistent heuristic, f_scores are
+    small integers that never decrease during the search, so the open set
+    is a bucket queue (Dial's algorithm): one list per f value and a cursor
+    that only moves forward, giving O(1) push and pop.
+    
     Args:
         maze: MazeGrid object containing the maze
+        start_pos: Start position to search from (defaults to maze.start)
+        goal_pos: Goal position to search for (defaults to maze.goal)
         
     Returns:
         List of (row, col) tuples representing the path, or None if unreachable
     """
-    start = maze.start
-    goal = maze.goal
-    
-    # Priority queue: stores (f_score, counter, position)
-    # counter ensures consistent ordering when f_scores are equal
-    open_set = []
-    counter = 0
-    heapq.heappush(open_set, (0, counter, start))
+    start_pos = maze.start if start_pos is None else start_pos
+    goal_pos = maze.goal if goal_pos is None else goal_pos
     
-    # Track where each node came from (for path reconstruction)
-    came_from = {}
+    width = maze.width
+    nbr_offsets = maze.nbr_offsets.tolist()
+    nbr_data = maze.nbr_data.tolist()
+    nbr_dirs = maze.nbr_dirs.tolist()
+    n = len(nbr_offsets) - 1
+    start = maze.to_index(start_pos)
+    goal = maze.to_index(goal_pos)
+    goal_r, goal_c = divmod(goal, width)
+    goal_bounds = maze.goal_bounds
+    h_table = manhattan_table(maze, goal_pos).tolist()
     
-    # g_score: cost from start to each node
-    g_score = defaultdict(lambda: float('inf'))
+    # g_score: cost from start to each cell
+    g_score = [INT32_MAX] * n
     g_score[start] = 0
     
-    # f_score: g_score + heuristic (estimated total cost)
-    f_score = defaultdict(lambda: float('inf'))
-    f_score[start] = manhattan_distance(start, goal)
+    # Track where each cell came from (for path reconstruction)
+    came_from = [-1] * n
     
-    # Track nodes currently in open_set
-    open_set_hash: Set[Tuple[int, int]] = {start}
+    # Cells already expanded (final, since Manhattan distance is consistent)
+    closed = bytearray(n)
     
-    while open_set:
-        # Get node with lowest f_score
-        current_f, _, current = heapq.heappop(open_set)
-        open_set_hash.discard(current)
+    # Bucket queue: buckets[f] holds the cells pushed with that f_score.
+    # No path is longer than the number of open cells, which bounds f.
+    # Cells are not removed when a cheaper path is found; the outdated
+    # entry is skipped when popped because its cell is already closed.
+    max_f = maze.open_count + maze.rows + maze.cols
+    buckets: List[List[int]] = [[] for _ in range(max_f + 1)]
+    current_f = h_table[start]
+    buckets[current_f].append(start)
+    queued = 1
+    
+    while queued:
+        # Get a cell with lowest f_score
+        bucket = buckets[current_f]
+        if not bucket:
+            current_f += 1
+            continue
+        current = bucket.pop()
+        queued -= 1
         
         # Goal reached! Reconstruct and return the path
         if current == goal:
-            return reconstruct_path(came_from, current)
+            return reconstruct_index_path(maze, came_from, goal, start)
         
-        # Explore neighbors
-        for neighbor in maze.get_neighbors(current):
-            # g_score for neighbor through current path
-            # Each step has cost of 1
-            tentative_g_score = g_score[current] + 1
+        # Skip stale entries whose cell has already been expanded
+        if closed[current]:
+            continue
+        closed[current] = 1
+        
+        # Each step has cost of 1
+        tentative_g_score = g_score[current] + 1
+        
+        # Explore neighbors, skipping edges pruned by goal bounds
+        for e in range(nbr_offsets[current], nbr_offsets[current + 1]):
+            neighbor = nbr_data[e]
+            if closed[neighbor]:
+                continue
+            if goal_bounds is not None:
+                row, col = divmod(current, width)
+                box = goal_bounds[row - 1, col - 1, nbr_dirs[e]]
+                if not (box[RMIN] <= goal_r - 1 <= box[RMAX] and box[CMIN] <= goal_c - 1 <= box[CMAX]):
+                    continue
             
-            # If this path to neighbor is better than previous ones
+            # If this path to neighbor is better than previous ones, record it
             if tentative_g_score < g_score[neighbor]:
-                # This is the best path to neighbor so far, record it
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = tentative_g_score + manhattan_distance(neighbor, goal)
-                
-                # Add neighbor to open_set if not already there
-                if neighbor not in open_set_hash:
-                    counter += 1
-                    heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
-                    open_set_hash.add(neighbor)
+                buckets[tentative_g_score + h_table[neighbor]].append(neighbor)
+                queued += 1
     
     # No path found - goal is unreachable
     return None
 
 
+@njit(nogil=True, cache=True, boundscheck=False)
+def _half_search_kernel(nbr_offsets, nbr_data, source, target, h_table, g_score, other_g_score, best):
+    """
+    One half of the parallel bidirectional A* search.
+    
+    Runs A* from source towards target, writing g_score in place so the
+    other half can read it concurrently. Whenever a relaxed cell already
+    has a g_score from the other half, the combined cost is a real path
+    length and lowers the shared best[0]. The search stops once its lowest
+    f_score reaches best[0], since no cheaper path can remain. Whichever half
+    finishes first - by that bound, by popping its target or by running out
+    of cells - raises the stop flag best[1] so the other half stops too.
+    Compiled with nogil so both halves run in parallel on separate threads.
+    
+    Args:
+        nbr_offsets, nbr_data: CSR adjacency from MazeGrid
+        source: Flat index this half starts from
+        target: Flat index this half searches towards
+        h_table: Heuristic per cell towards target from manhattan_table()
+        g_score: int32 array (all INT32_MAX) filled in by this half
+        other_g_score: The other half's g_score array (read only)
+        best: 2-element int64 array holding the best path cost found so far
+            and the shared stop flag
+        
+    Returns:
+        int32 array mapping each cell to its predecessor (-1 if none)
+    """
+    n = nbr_offsets.size - 1
+    came_from = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.uint8)
+    heap_f = np.empty(4 * n + 1, dtype=np.int32)
+    heap_idx = np.empty(4 * n + 1, dtype=np.int32)
+    
+    g_score[source] = 0
+    size = _heap_push(heap_f, heap_idx, 0, h_table[source], source)
+    
+    while size > 0:
+        current_f, current, size = _heap_pop(heap_f, heap_idx, size)
+        if best[1] or current == target or current_f >= best[0]:
+            break
+        
+        # Manhattan distance is consistent, so a popped cell is final:
+        # skip stale heap entries for cells that are already closed
+        if closed[current]:
+            continue
+        closed[current] = 1
+        g = g_score[current]
+        
+        for e in range(nbr_offsets[current], nbr_offsets[current + 1]):
+            neighbor = nbr_data[e]
+            if closed[neighbor]:
+                continue
+            tentative_g_score = g + 1
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                size = _heap_push(heap_f, heap_idx, size, tentative_g_score + h_table[neighbor], neighbor)
+                
+                # The other half already reached this cell: complete path found.
+                # A lost race here only delays termination; the meeting cell is
+                # chosen from the final g_scores.
+                other_g = other_g_score[neighbor]
+                if other_g != INT32_MAX and tentative_g_score + other_g < best[0]:
+                    best[0] = tentative_g_score + other_g
+    
+    # This half's result is final either way, so the other half can stop
+    best[1] = 1
+    return came_from
+
+
+# Worker thread for the backward half, reused across searches so each call
+# does not pay for starting and joining a thread. Created on first use, so
+# importing this module without Numba never starts a pool.
+_bidirectional_executor: Optional[ThreadPoolExecutor] = None
+
+
+def a_star_search_bidirectional(maze: MazeGrid) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find the shortest path with bidirectional A* Search.
+    
+    With Numba installed, the forward and backward halves run concurrently
+    on two threads (the kernels release the GIL) and share only the best
+    path cost found so far. Otherwise the pure-Python version alternates
+    between the two halves.
+    
+    This is not a faster a_star_search: on solvable mazes the threaded
+    version is slower than the unidirectional kernel (thread handoff and
+    the second heap outweigh the smaller frontiers). It only wins when
+    one side is walled off, so its half runs out of cells early.
+    
+    Args:
+        maze: MazeGrid object containing the maze
+        
+    Returns:
+        List of (row, col) tuples representing the path, or None if unreachable
+    """
+    if not NUMBA_AVAILABLE:
+        return _a_star_bidirectional_python(maze)
+    
+    global _bidirectional_executor
+    if _bidirectional_executor is None:
+        _bidirectional_executor = ThreadPoolExecutor(max_workers=1)
+    
+    start = maze.to_index(maze.start)
+    goal = maze.to_index(maze.goal)
+    n = len(maze.nbr_offsets) - 1
+    g_forward = np.full(n, INT32_MAX, dtype=np.int32)
+    g_backward = np.full(n, INT32_MAX, dtype=np.int32)
+    # Seed both sources so the first relaxation into either one is seen
+    g_forward[start] = 0
+    g_backward[goal] = 0
+    best = np.array([INT32_MAX, 0], dtype=np.int64)
+    
+    # The backward half runs on the shared worker while the forward half
+    # runs on this thread
+    backward = _bidirectional_executor.submit(_half_search_kernel, maze.nbr_offsets, maze.nbr_data, goal, start,
+                                              manhattan_table(maze, maze.start), g_backward, g_forward, best)
+    came_from_forward = _half_search_kernel(maze.nbr_offsets, maze.nbr_data, start, goal,
+                                            manhattan_table(maze, maze.goal), g_forward, g_backward, best)
+    came_from_backward = backward.result()
+    
+    # Meeting cell: the cheapest cell reached by both halves
+    total = g_forward.astype(np.int64) + g_backward
+    meeting = int(np.argmin(total))
+    if total[meeting] >= INT32_MAX:
+        return None
+    
+    # start -> meeting from the forward tree, then meeting -> goal from the backward tree
+    path = reconstruct_index_path(maze, came_from_forward, meeting)
+    # The forward half reached the meeting cell, so the path exists
+    assert path is not None
+    current = meeting
+    while came_from_backward[current] != -1:
+        current = came_from_backward[current]
+        path.append(maze.to_pos(current))
+    return path
+
+
+def _a_star_bidirectional_python(maze: MazeGrid) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find the shortest path with bidirectional A* Search.
+    
+    Two A* searches run in alternation: a forward one from start (heuristic
+    towards goal) and a backward one from goal (heuristic towards start).
+    Whenever a relaxed node already has a g_score from the other side, the
+    two halves form a complete path and the best such meeting is recorded.
+    The search stops once either frontier's lowest f_score can no longer
+    beat the best meeting path.
+    
+    Args:
+        maze: MazeGrid object containing the maze
+        
+    Returns:
+        List of (row, col) tuples representing the path, or None if unreachable
+    """
+    start = maze.start
+    goal = maze.goal
+    
+    # Index 0 = forward search (start -> goal), 1 = backward search (goal -> start)
+    targets = (goal, start)
+    open_sets = ([(manhattan_distance(start, goal), start)],
+                 [(manhattan_distance(goal, start), goal)])
+    g_scores = ({start: 0}, {goal: 0})
+    came_from = ({}, {})
+    closed: Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]] = (set(), set())
+    
+    best_cost = float('inf')
+    meeting = None
+    side = 1
+    
+    while open_sets[0] and open_sets[1]:
+        # Both heap tops are lower bounds on the remaining path cost
+        # (consistent heuristic), so either one reaching best_cost proves
+        # no better meeting can still be found
+        if max(open_sets[0][0][0], open_sets[1][0][0]) >= best_cost:
+            break
+        
+        # Alternate between the forward and backward search
+        side ^= 1
+        open_set = open_sets[side]
+        g_score = g_scores[side]
+        other_g_score = g_scores[side ^ 1]
+        target = targets[side]
+        
+        current_f, current = heapq.heappop(open_set)
+        if current in closed[side]:
+            continue
+        closed[side].add(current)
+        
+        for neighbor in maze.get_neighbors(current):
+            tentative_g_score = g_score[current] + 1
+            if tentative_g_score < g_score.get(neighbor, float('inf')):
+                came_from[side][neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                heapq.heappush(open_set, (tentative_g_score + manhattan_distance(neighbor, target),
+                                          neighbor))
+                
+                # The other search already reached this node: complete path found
+                if neighbor in other_g_score:
+                    path_cost = tentative_g_score + other_g_score[neighbor]
+                    if path_cost < best_cost:
+                        best_cost = path_cost
+                        meeting = neighbor
+    
+    if meeting is None:
+        return None
+    
+    # start -> meeting from the forward tree, then meeting -> goal from the backward tree
+    path = reconstruct_path(came_from[0], meeting)
+    current = meeting
+    while current in came_from[1]:
+        current = came_from[1][current]
+        path.append(current)
+    return path
+
+
 def reconstruct_path(came_from: dict, current: Tuple[int, int]) -> List[Tuple[int, int]]:
     """
     Reconstruct the path from start to goal by backtracking.
@@ -195,62 +980,85 @@ def reconstruct_path(came_from: dict, current: Tuple[int, int]) -> List[Tuple[in
     return path
 
 
+def reconstruct_index_path(maze: MazeGrid, came_from: Sequence[int], goal_idx: int,
+                           start_idx: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
+    """
+    Reconstruct the path from a flat predecessor array.
+    
+    Walks the predecessors twice: once to count the path length and once
+    to fill a preallocated int32 buffer from the end.
+    
+    Args:
+        maze: MazeGrid the indices refer to
+        came_from: Array mapping each cell index to its predecessor (-1 if none)
+        goal_idx: Flat index of the goal cell
+        start_idx: Flat index of the start cell (defaults to maze.start)
+        
+    Returns:
+        List of positions from start to goal, or None if the goal was never reached
+    """
+    if start_idx is None:
+        start_idx = maze.to_index(maze.start)
+    if goal_idx != start_idx and came_from[goal_idx] == -1:
+        return None
+    
+    # First pass: count the cells on the path
+    length = 1
+    current = goal_idx
+    while current != start_idx:
+        current = came_from[current]
+        length += 1
+    
+    # Second pass: fill a preallocated buffer back to front, so no reverse is needed
+    cells = np.empty(length, dtype=np.int32)
+    current = goal_idx
+    for i in range(length - 1, -1, -1):
+        cells[i] = current
+        current = came_from[current]
+    
+    # Convert to (row, col) only at the API boundary
+    rows, cols = np.divmod(cells, maze.width)
+    return list(zip((rows - 1).tolist(), (cols - 1).tolist()))
+
+
 def visualize_maze(maze: MazeGrid, path: Optional[List[Tuple[int, int]]] = None):
     """
     Display the maze in the console with the solved path.
     
+    The whole picture is built as one string and written with a single
+    sys.stdout.write call instead of one print per cell.
+    
     Args:
         maze: MazeGrid object
         path: Optional list of positions representing the solution path
     """
-    # ANSI color codes for terminal
-    RESET = '\033[0m'
-    GREEN = '\033[92m'      # Start
-    RED = '\033[91m'        # Goal
-    YELLOW = '\033[93m'     # Path
-    BLUE = '\033[94m'       # Wall
-    WHITE = '\033[97m'      # Empty space
-    
-    # Create a copy of the grid for visualization
-    visual_grid = [row[:] for row in maze.grid]
+    # Path cells are drawn as '*' (excluding start and goal)
+    on_path = set(path[1:-1]) if path else set()
     
-    # Mark the path with '*' (excluding start and goal)
-    if path:
-        for pos in path[1:-1]:  # Skip start and goal
-            row, col = pos
-            visual_grid[row][col] = '*'
-    
-    # Print the maze
-    print("\n" + "=" * (maze.cols * 2 + 3))
-    print(" MAZE SOLVER - A* SEARCH ALGORITHM")
-    print("=" * (maze.cols * 2 + 3))
-    
-    for r in range(maze.rows):
-        print(" ", end="")
-        for c in range(maze.cols):
-            cell = visual_grid[r][c]
-            
-            if cell == 'S':
-                print(f"{GREEN}S{RESET}", end=" ")
-            elif cell == 'G':
-                print(f"{RED}G{RESET}", end=" ")
-            elif cell == '#':
-                print(f"{BLUE}#{RESET}", end=" ")
-            elif cell == '*':
-                print(f"{YELLOW}*{RESET}", end=" ")
-            else:
-                print(f"{WHITE}.{RESET}", end=" ")
-        print()
-    
-    print("=" * (maze.cols * 2 + 3))
+    lines = [
+        "",
+        "=" * (maze.cols * 2 + 3),
+        " MAZE SOLVER - A* SEARCH ALGORITHM",
+        "=" * (maze.cols * 2 + 3),
+    ]
+    for r, row in enumerate(maze.grid):
+        lines.append(" " + "".join(
+            RENDER['*'] if (r, c) in on_path else RENDER.get(cell, RENDER[' '])
+            for c, cell in enumerate(row)
+        ))
+    lines.append("=" * (maze.cols * 2 + 3))
     
     # Legend
-    print(f"\nLegend:")
-    print(f"  {GREEN}S{RESET} = Start")
-    print(f"  {RED}G{RESET} = Goal")
-    print(f"  {BLUE}#{RESET} = Wall/Obstacle")
-    print(f"  {YELLOW}*{RESET} = Solution Path")
-    print(f"  {WHITE}.{RESET} = Open Space")
+    lines += [
+        "",
+        "Legend:",
+        f"  {GREEN}S{RESET} = Start",
+        f"  {RED}G{RESET} = Goal",
+        f"  {BLUE}#{RESET} = Wall/Obstacle",
+        f"  {YELLOW}*{RESET} = Solution Path",
+        f"  {WHITE}.{RESET} = Open Space",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def get_maze_dimensions() -> Tuple[int, int]:
     """Get maze dimensions from user input."""
@@ -272,18 +1080,26 @@ def create_custom_maze() -> Optional[List[List[str]]]:
         print(f"\nEnter the maze layout ({rows}x{cols}). Use 'S' for start, 'G' for goal, '#' for walls, and ' ' for open paths.")
         
         maze = []
+        start_count = 0
+        goal_count = 0
         for r in range(rows):
             while True:
                 row_input = input(f"Row {r + 1}: ")
-                if len(row_input) == cols:
-                    maze.append(list(row_input))
+                if len(row_input) != cols:
+                    print(f"Invalid input. Please enter exactly {cols} characters for each row.")
+                elif not MAZE_SYMBOLS.issuperset(row_input):
+                    print("Invalid input. Rows may only contain 'S', 'G', '#' and ' '.")
+                else:
                     break
-                print(f"Invalid input. Please enter exactly {cols} characters for each row.")
+            
+            # Count start/goal symbols as each row is read, so the maze is never rescanned
+            start_count += row_input.count('S')
+            goal_count += row_input.count('G')
+            maze.append(list(row_input))
         
-        # Validate maze content (e.g., ensure 'S' and 'G' are present)
-        flat_maze = [cell for row in maze for cell in row]
-        if 'S' not in flat_maze or 'G' not in flat_maze:
-            print("\nError: The maze must contain at least one 'S' (start) and one 'G' (goal).")
+        # Validate maze content: exactly one 'S' and one 'G'
+        if start_count != 1 or goal_count != 1:
+            print("\nError: The maze must contain exactly one 'S' (start) and one 'G' (goal).")
             return None
             
         return maze
@@ -371,7 +1187,7 @@ def main():
     print("\n" + "─" * 52)
     print("Algorithm: A* Search")
     print("Heuristic: Manhattan Distance")
-    print("Data Structure: Min-Heap Priority Queue (heapq)")
+    print(f"Data Structure: {BACKEND_QUEUES[a_star_backend(maze)]}")
     print("─" * 52 + "\n")
 
 
@@ -0,0 +1,13 @@
+"""
+Build the optional Cython A* extension next to main.py:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="terminal-maze-astar",
+    ext_modules=cythonize("_astar.pyx"),
+)